@@ -9,6 +9,7 @@ import os
 import json
 import hashlib
 import asyncio
+import functools
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any, Tuple, Union
 from dataclasses import dataclass, field, asdict
@@ -17,9 +18,11 @@ import logging
 from collections import defaultdict
 try:
     import chromadb
+    from chromadb.utils import embedding_functions
     HAS_CHROMADB = True
 except ImportError:
     chromadb = None
+    embedding_functions = None
     HAS_CHROMADB = False
 
 logging.basicConfig(level=logging.INFO)
@@ -133,15 +136,24 @@ class TaskResult:
         }
 
 
+@functools.lru_cache(maxsize=None)
+def _get_embedder():
+    """Process-wide embedding function, so the model is loaded once however many stores are opened"""
+    return embedding_functions.DefaultEmbeddingFunction()
+
+
 class VectorMemory:
     """Wrapper for ChromaDB vector operations"""
     def __init__(self, storage_path: str):
         self.client = chromadb.PersistentClient(path=os.path.join(storage_path, "chroma"))
-        self.collection = self.client.get_or_create_collection(name="openclaw_memory")
+        self.collection = self.client.get_or_create_collection(
+            name="openclaw_memory",
+            embedding_function=_get_embedder()
+        )
 
-    def add(self, content: str, memory_id: str, metadata: Dict = None):
-        """Add document to vector store"""
-        # Ensure metadata values are strings or numbers for ChromaDB
+    @staticmethod
+    def _clean_metadata(metadata: Dict = None) -> Dict:
+        """Ensure metadata values are strings or numbers for ChromaDB"""
         clean_metadata = {}
         if metadata:
             for k, v in metadata.items():
@@ -149,11 +161,24 @@ class VectorMemory:
                     clean_metadata[k] = v
                 else:
                     clean_metadata[k] = str(v)
+        return clean_metadata
 
+    def add(self, content: str, memory_id: str, metadata: Dict = None):
+        """Add document to vector store"""
         self.collection.add(
             documents=[content],
             ids=[memory_id],
-            metadatas=[clean_metadata]
+            metadatas=[self._clean_metadata(metadata)]
+        )
+
+    def add_many(self, contents: List[str], memory_ids: List[str], metadatas: List[Dict]):
+        """Add several documents in one call, so they are embedded and written as a single batch"""
+        if not contents:
+            return
+        self.collection.add(
+            documents=contents,
+            ids=memory_ids,
+            metadatas=[self._clean_metadata(m) for m in metadatas]
         )
 
     def search(self, query: str, limit: int = 5) -> List[str]:
@@ -219,6 +244,48 @@ class MemorySystem:
               metadata: Dict = None, tags: List[str] = None,
               importance: float = 0.5) -> str:
         """Store a new memory entry and index it in the vector store"""
+        entry = self._new_entry(content, memory_type, metadata, tags, importance)
+        
+        # Index in ChromaDB
+        meta_to_store = metadata or {}
+        meta_to_store["type"] = memory_type.value
+        self.vector_store.add(content, entry.id, meta_to_store)
+        
+        self._index_entry(entry)
+        
+        # Manage memory limit
+        if len(self.memories) > self.max_memories:
+            self._consolidate_memories()
+        
+        return entry.id
+    
+    def store_many(self, items: List[Tuple[str, MemoryType, List[str]]],
+                   importance: float = 0.5) -> List[str]:
+        """Store several (content, memory_type, tags) entries with a single vector store write"""
+        entries = [
+            self._new_entry(content, memory_type, None, tags, importance)
+            for content, memory_type, tags in items
+        ]
+        
+        # One ChromaDB add for the whole batch
+        self.vector_store.add_many(
+            [entry.content for entry in entries],
+            [entry.id for entry in entries],
+            [{"type": entry.type.value} for entry in entries]
+        )
+        
+        for entry in entries:
+            self._index_entry(entry)
+        
+        # Manage memory limit
+        if len(self.memories) > self.max_memories:
+            self._consolidate_memories()
+        
+        return [entry.id for entry in entries]
+    
+    def _new_entry(self, content: str, memory_type: MemoryType, metadata: Dict = None,
+                   tags: List[str] = None, importance: float = 0.5) -> MemoryEntry:
+        """Create a memory entry and add it to the in-memory store"""
         memory_id = self._generate_id(content)
         
         entry = MemoryEntry(
@@ -232,27 +299,18 @@ class MemorySystem:
         )
         
         self.memories[memory_id] = entry
-        
-        # Index in ChromaDB
-        meta_to_store = metadata or {}
-        meta_to_store["type"] = memory_type.value
-        self.vector_store.add(content, memory_id, meta_to_store)
-        
-        # Update classic indices
+        return entry
+    
+    def _index_entry(self, entry: MemoryEntry):
+        """Update the tag, type and date indices for a newly stored entry"""
         for tag in entry.tags:
-            self.tag_index[tag].append(memory_id)
-        self.type_index[memory_type].append(memory_id)
+            self.tag_index[tag].append(entry.id)
+        self.type_index[entry.type].append(entry.id)
         
         date_key = datetime.now().strftime("%Y-%m-%d")
-        self.time_index[date_key].append(memory_id)
+        self.time_index[date_key].append(entry.id)
         
         self.stats["total_memories"] += 1
-        
-        # Manage memory limit
-        if len(self.memories) > self.max_memories:
-            self._consolidate_memories()
-        
-        return memory_id
     
     def retrieve(self, memory_id: str) -> Optional[MemoryEntry]:
         """Retrieve a memory by ID"""
@@ -494,27 +552,46 @@ class MemorySystem:
             date_key = datetime.fromisoformat(entry.timestamp).strftime("%Y-%m-%d")
             self.time_index[date_key].append(mid)
     
+    def _snapshot(self) -> Dict[str, str]:
+        """State to persist as JSON text, keyed by file name"""
+        # Encoded here, not in _write_snapshot: to_dict hands out the live metadata/tags/details
+        # dicts, so json must walk them before anything else gets a chance to change them
+        data = {
+            "memories.json": {
+                "memories": {mid: entry.to_dict() for mid, entry in self.memories.items()},
+                "stats": dict(self.stats)
+            },
+            "strategies.json": {sid: memo.to_dict() for sid, memo in self.strategies.items()},
+            "task_history.json": [t.to_dict() for t in self.task_history],
+        }
+        return {filename: json.dumps(content, indent=2) for filename, content in data.items()}
+    
+    def _write_snapshot(self, snapshot: Dict[str, str]):
+        """Write each file via a synced temp file, so a crash never leaves a truncated one"""
+        for filename, text in snapshot.items():
+            path = os.path.join(self.storage_path, filename)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+    
     def save_to_disk(self):
         """Save all memories to disk"""
         try:
-            # Save memories
-            memories_file = os.path.join(self.storage_path, "memories.json")
-            with open(memories_file, 'w') as f:
-                json.dump({
-                    "memories": {mid: entry.to_dict() for mid, entry in self.memories.items()},
-                    "stats": self.stats
-                }, f, indent=2)
-            
-            # Save strategies
-            strategies_file = os.path.join(self.storage_path, "strategies.json")
-            with open(strategies_file, 'w') as f:
-                json.dump({sid: memo.to_dict() for sid, memo in self.strategies.items()}, f, indent=2)
-            
-            # Save task history
-            history_file = os.path.join(self.storage_path, "task_history.json")
-            with open(history_file, 'w') as f:
-                json.dump([t.to_dict() for t in self.task_history], f, indent=2)
+            self._write_snapshot(self._snapshot())
+            logger.info("Memories saved to disk")
             
+        except Exception as e:
+            logger.error(f"Error saving memories: {e}")
+    
+    async def save_to_disk_async(self):
+        """Save all memories to disk without blocking the event loop"""
+        try:
+            # Encode on the loop, where no other task can change state mid-save; only write and fsync in a thread
+            snapshot = self._snapshot()
+            await asyncio.to_thread(self._write_snapshot, snapshot)
             logger.info("Memories saved to disk")
             
         except Exception as e:
@@ -19,19 +19,25 @@ class P2PManager:
         self.gist_id = os.environ.get('HIVEMIND_GIST_ID', '')
         self.token = os.environ.get('GH_PAT') or os.environ.get('GH_TOKEN') or os.environ.get('GITHUB_TOKEN', '')
         self.filename = 'openclaw_hivemind.json'
+        # Last HiveMind file seen and its ETag, for conditional GETs
+        self._etag: Optional[str] = None
+        self._cached_content: Optional[str] = None
         
         if not self.gist_id:
             logger.warning("P2P: HIVEMIND_GIST_ID not set. P2P discovery disabled.")
 
-    def _github_api(self, method: str, url: str, data: dict = None) -> Optional[dict]:
-        if not self.token:
-            return None
-        
-        headers = {
+    def _headers(self) -> Dict[str, str]:
+        return {
             'Authorization': f'token {self.token}',
             'Accept': 'application/vnd.github.v3+json',
             'Content-Type': 'application/json',
         }
+
+    def _github_api(self, method: str, url: str, data: dict = None) -> Optional[dict]:
+        if not self.token:
+            return None
+        
+        headers = self._headers()
         
         body = json.dumps(data).encode('utf-8') if data else None
         req = urllib.request.Request(url, data=body, headers=headers, method=method)
@@ -86,11 +92,38 @@ class P2PManager:
 
     def _read_state(self) -> Optional[dict]:
         if not self.gist_id: return None
-        result = self._github_api('GET', f'https://api.github.com/gists/{self.gist_id}')
-        if result and 'files' in result:
-            content = result['files'].get(self.filename, {}).get('content', '{}')
-            return json.loads(content)
-        return None
+        content = self._fetch_state_content()
+        # Parsed fresh on every read, since callers mutate the returned state
+        return json.loads(content) if content is not None else None
+
+    def _fetch_state_content(self) -> Optional[str]:
+        """Conditional GET of the HiveMind file; a 304 reuses the last downloaded copy."""
+        if not self.token:
+            return None
+        
+        headers = self._headers()
+        if self._etag and self._cached_content is not None:
+            headers['If-None-Match'] = self._etag
+        req = urllib.request.Request(f'https://api.github.com/gists/{self.gist_id}', headers=headers, method='GET')
+        
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                result = json.loads(resp.read().decode('utf-8'))
+                etag = resp.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return self._cached_content
+            logger.error(f"P2P GitHub API error: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"P2P GitHub API error: {e}")
+            return None
+        
+        if 'files' not in result:
+            return None
+        self._etag = etag
+        self._cached_content = result['files'].get(self.filename, {}).get('content', '{}')
+        return self._cached_content
 
     def _write_state(self, state: dict):
         if not self.gist_id: return
@@ -12,31 +12,39 @@ class PostizClient:
     Client for interacting with the Postiz Social Media Scheduling API.
     """
     
-    def __init__(self, api_key: str = None, base_url: str = "http://localhost:5000/api"):
+    def __init__(self, api_key: str = None, base_url: str = "http://localhost:5000/api",
+                 session: Optional[aiohttp.ClientSession] = None):
         self.api_key = api_key or os.getenv("POSTIZ_API_KEY")
         self.base_url = base_url or os.getenv("POSTIZ_URL", "http://localhost:5000/api")
-        self.session: Optional[aiohttp.ClientSession] = None
+        # A caller-provided session (e.g. SocialMediaManager's pool) is shared and never closed here
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._shared_session = session is not None
+        self._owns_session = False
+        # Sent per request, so a shared session needs no Postiz-specific defaults
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
         
         if not self.api_key:
             logger.warning("Postiz API Key not found. Social posting will fail.")
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(headers={
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        })
+        await self.ensure_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
 
     async def ensure_session(self):
-        if not self.session:
-            self.session = aiohttp.ClientSession(headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            })
+        if self.session and not self.session.closed:
+            return
+        if self._shared_session:
+            # Creating a private fallback here would leak it: the caller never closes this client
+            raise RuntimeError("Shared Postiz session is closed; assign an open session before posting")
+        self.session = aiohttp.ClientSession()
+        self._owns_session = True
 
     async def create_post(self, content: str, platforms: List[str], media_urls: List[str] = None, schedule_time: str = None) -> Dict:
         """
@@ -64,7 +72,7 @@ class PostizClient:
         endpoint = f"{self.base_url}/posts"
         
         try:
-            async with self.session.post(endpoint, json=payload) as response:
+            async with self.session.post(endpoint, json=payload, headers=self.headers) as response:
                 if response.status in [200, 201]:
                     data = await response.json()
                     logger.info(f"Post created successfully in Postiz: {data.get('id')}")
@@ -83,7 +91,7 @@ class PostizClient:
         endpoint = f"{self.base_url}/integrations"
         
         try:
-            async with self.session.get(endpoint) as response:
+            async with self.session.get(endpoint, headers=self.headers) as response:
                 if response.status == 200:
                     return await response.json()
                 return []
@@ -1,5 +1,6 @@
 import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import List, Dict, Any
 from crewai import Agent, Task, Crew, Process
 from core.langchain_wrapper import UnifiedLangChainLLM
@@ -14,6 +15,9 @@ class OpenCLAW_ScientificCrew:
     Enhanced with P2P Collaboration and decentralized data exchange.
     """
     
+    # Seconds to wait for each independent stage of conduct_research_parallel
+    STAGE_TIMEOUT = 180
+    
     def __init__(self):
         # Initialize the unified rotator wrapped in a LangChain LLM
         self.llm = UnifiedLangChainLLM()
@@ -67,37 +71,60 @@ class OpenCLAW_ScientificCrew:
             allow_delegation=True
         )
 
-    def conduct_research(self, topic: str):
-        """Runs a complete scientific research cycle on a specific topic."""
-        session_id = str(uuid.uuid4())
-        
-        # Define Tasks
-        exploration_task = Task(
+    def _exploration_task(self, topic: str) -> Task:
+        return Task(
             description=f"Search for at least 5 relevant scientific papers on the topic: {topic}. Focus on recent (last 2 years) and high-impact papers.",
             expected_output="A list of 5 papers with titles, authors, and brief summaries.",
             agent=self.explorer
         )
-        
-        synthesis_task = Task(
-            description="Synthesize the findings from the discovered papers. Identify the current state of the art, key debates, and open questions.",
+
+    def _synthesis_task(self, papers: str = "", context: List[Task] = None) -> Task:
+        """Synthesis of the papers, taken from `context` or passed in as text."""
+        description = "Synthesize the findings from the discovered papers. Identify the current state of the art, key debates, and open questions."
+        if papers:
+            description += f"\n\nPapers:\n{papers}"
+        extra = {"context": context} if context else {}
+        return Task(
+            description=description,
             expected_output="A comprehensive synthesis report (300-500 words) summarizing the research landscape.",
             agent=self.reviewer,
-            context=[exploration_task]
+            **extra
         )
 
-        proposal_task = Task(
-            description=f"Based on the synthesis, generate a structured research proposal for a new experiment or exploration in the field of {topic}.",
+    def _proposal_task(self, topic: str, synthesis_task: Task, peer_insights: str = "") -> Task:
+        description = f"Based on the synthesis, generate a structured research proposal for a new experiment or exploration in the field of {topic}."
+        if peer_insights:
+            description += f" Take these peer insights into account.\n\nPeer insights:\n{peer_insights}"
+        return Task(
+            description=description,
             expected_output="A research proposal including title, objective, hypothesis, and proposed methodology.",
             agent=self.chief_scientist,
             context=[synthesis_task]
         )
 
-        p2p_sharing_task = Task(
-            description=f"Share the key findings and the research proposal with the P2P network. Also, check for any relevant peer insights that could enhance the proposal.",
-            expected_output="Confirmation that the knowledge has been shared and a summary of any useful peer insights found.",
+    def _sharing_task(self, synthesis_task: Task, proposal_task: Task, check_peers: bool = True) -> Task:
+        if check_peers:
+            description = "Share the key findings and the research proposal with the P2P network. Also, check for any relevant peer insights that could enhance the proposal."
+            expected_output = "Confirmation that the knowledge has been shared and a summary of any useful peer insights found."
+        else:
+            description = "Share the key findings and the research proposal with the P2P network."
+            expected_output = "Confirmation that the knowledge has been shared."
+        return Task(
+            description=description,
+            expected_output=expected_output,
             agent=self.p2p_collaborator,
             context=[synthesis_task, proposal_task]
         )
+
+    def conduct_research(self, topic: str):
+        """Runs a complete scientific research cycle on a specific topic."""
+        session_id = str(uuid.uuid4())
+        
+        # Define Tasks
+        exploration_task = self._exploration_task(topic)
+        synthesis_task = self._synthesis_task(context=[exploration_task])
+        proposal_task = self._proposal_task(topic, synthesis_task)
+        p2p_sharing_task = self._sharing_task(synthesis_task, proposal_task)
         
         # Define Crew
         crew = Crew(
@@ -115,6 +142,64 @@ class OpenCLAW_ScientificCrew:
         
         return result
 
+    def _lit_search(self, topic: str) -> str:
+        """Literature search stage: the explorer alone, in its own crew."""
+        task = self._exploration_task(topic)
+        return str(Crew(agents=[self.explorer], tasks=[task], process=Process.sequential, verbose=True).kickoff())
+
+    def _peer_insights(self, topic: str) -> str:
+        """Peer-insight stage: read what other agents have published, independent of the literature search."""
+        task = Task(
+            description=f"Check the P2P network for recent peer insights relevant to the topic: {topic}.",
+            expected_output="A summary of the useful peer insights found, or a note that there were none.",
+            agent=self.p2p_collaborator
+        )
+        return str(Crew(agents=[self.p2p_collaborator], tasks=[task], process=Process.sequential, verbose=True).kickoff())
+
+    def conduct_research_parallel(self, topic: str):
+        """
+        Runs the research cycle with its independent stages overlapped.
+        The literature search and the peer-insight check run in parallel threads (both are
+        dominated by LLM and HTTP waits); synthesis, proposal and sharing then run in order.
+        A stage that exceeds STAGE_TIMEOUT is logged and the cycle goes on without its output.
+        Its worker thread cannot be interrupted, though: it keeps running in the background
+        and, since executor threads are joined at exit, still delays interpreter shutdown.
+        """
+        session_id = str(uuid.uuid4())
+        logger.info(f"Starting parallel Scientific Crew execution for session {session_id} and topic: {topic}")
+        
+        stages = {"papers": self._lit_search, "peer_insights": self._peer_insights}
+        found = {}
+        executor = ThreadPoolExecutor(max_workers=len(stages))
+        try:
+            futures = {name: executor.submit(fn, topic) for name, fn in stages.items()}
+            for name, future in futures.items():
+                try:
+                    found[name] = future.result(timeout=self.STAGE_TIMEOUT)
+                except FutureTimeoutError:
+                    logger.error(f"Stage '{name}' timed out after {self.STAGE_TIMEOUT}s for session {session_id}")
+                    found[name] = ""
+        finally:
+            # Returns without waiting for a timed-out stage; its thread still runs to completion
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        synthesis_task = self._synthesis_task(papers=found["papers"] or "No papers were found: the literature search timed out.")
+        proposal_task = self._proposal_task(topic, synthesis_task, peer_insights=found["peer_insights"])
+        p2p_sharing_task = self._sharing_task(synthesis_task, proposal_task, check_peers=False)
+        
+        crew = Crew(
+            agents=[self.chief_scientist, self.reviewer, self.p2p_collaborator],
+            tasks=[synthesis_task, proposal_task, p2p_sharing_task],
+            process=Process.sequential,
+            verbose=True
+        )
+        result = crew.kickoff()
+        
+        # Record results in Analytics
+        self.analytics.record_session(session_id, result)
+        
+        return result
+
 if __name__ == "__main__":
     # Example test run
     manager = OpenCLAW_ScientificCrew()
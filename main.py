@@ -420,7 +420,7 @@ class AutonomousLiteraryAgent:
                         schedule.mark_completed()
                         
                         # Save memory after each task
-                        self.memory.save_to_disk()
+                        await self.memory.save_to_disk_async()
                 
                 # Sleep before next check
                 await asyncio.sleep(60)  # Check every minute
@@ -444,7 +444,7 @@ class AutonomousLiteraryAgent:
             tags=["shutdown"],
             importance=0.9
         )
-        self.memory.save_to_disk()
+        await self.memory.save_to_disk_async()
         
         # Save LLM state
         if self.llm_provider:
@@ -492,4 +492,10 @@ if __name__ == "__main__":
     ╚═══════════════════════════════════════════════════════════════╝
     """)
     
+    # libuv-backed event loop when available; the agent is almost entirely network I/O
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -9,6 +9,8 @@ import json
 import asyncio
 import aiohttp
 import csv
+import functools
+import re
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any, Tuple
 from dataclasses import dataclass, field
@@ -19,6 +21,32 @@ import random
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_FIELD_RE = re.compile(r'\{(\w+)\}')
+
+
+def _compile_template(template: str):
+    """
+    Split a {field} template once into literal/field tokens and return a renderer.
+    Only plain {field} placeholders are supported: str.format's {{ and }} escapes would be
+    emitted doubled, so templates containing them are rejected.
+    """
+    if "{{" in template or "}}" in template:
+        raise ValueError("Compiled templates do not support str.format's {{ }} escapes")
+    # re.split with one group alternates literal, field, literal, ...
+    tokens = tuple(
+        part if i % 2 == 0 else (part,)
+        for i, part in enumerate(_FIELD_RE.split(template))
+        if part
+    )
+    
+    def render(values: Dict[str, Any]) -> str:
+        return "".join(
+            part if isinstance(part, str) else str(values[part[0]])
+            for part in tokens
+        )
+    
+    return render
+
 
 class LibraryType(Enum):
     PUBLIC = "public"
@@ -299,14 +327,33 @@ Web: www.franciscoangulo.com"""
     @classmethod
     def generate_email(cls, library: Library) -> Tuple[str, str]:
         """Generate personalized email for a library"""
-        lang = library.preferred_language
-        template = cls.TEMPLATES.get(lang, cls.TEMPLATES["EN"])
-        
         # Personalize with library name
         name = library.name if library.name else "Librarian"
-        body = template["body"].format(name=name)
-        
-        return template["subject"], body
+        return cls._render_email(library.preferred_language, name)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _render_email(cls, lang: str, name: str) -> Tuple[str, str]:
+        """Render (subject, body) for a language/name pair; memoized for retries and previews"""
+        if lang not in cls.TEMPLATES:
+            lang = "EN"
+        body = cls._compiled_bodies[lang]({"name": name})
+        
+        return cls.TEMPLATES[lang]["subject"], body
+    
+    @classmethod
+    def _compile_templates(cls):
+        """Compile every body template into a renderer"""
+        cls._compiled_bodies = {
+            lang: _compile_template(template["body"])
+            for lang, template in cls.TEMPLATES.items()
+        }
+    
+    @classmethod
+    def clear_cache(cls):
+        """Recompile templates and drop memoized emails; call after editing TEMPLATES at runtime"""
+        cls._compile_templates()
+        cls._render_email.cache_clear()
     
     @classmethod
     def generate_follow_up(cls, library: Library, days_since_contact: int) -> Tuple[str, str]:
@@ -345,6 +392,10 @@ Literary Agent - Francisco Angulo de Lafuente"""
         return subject, body
 
 
+# Compile the body templates once at import
+EmailTemplateGenerator._compile_templates()
+
+
 class LibraryDatabase:
     """Manages the library contact database"""
     
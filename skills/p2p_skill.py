@@ -1,6 +1,7 @@
 import os
 import json
 import logging
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 from core.p2p_manager import P2PManager
 from core.torrent_manager import TorrentManager
@@ -16,13 +17,17 @@ class P2PSkill:
     def __init__(self, agent_id: str = "OpenCLAW-Global-Node"):
         self.p2p = P2PManager(agent_id)
         self.torrent = TorrentManager()
-        self._is_connected = False
+
+    @cached_property
+    def _is_connected(self) -> bool:
+        """Registers presence on first access; a failed attempt is not cached and is retried."""
+        self.p2p.register_presence()
+        return True
 
     def connect(self) -> str:
         """Joins the global OpenCLAW P2P network."""
         try:
-            self.p2p.register_presence()
-            self._is_connected = True
+            _ = self._is_connected
             return f"✅ Agent '{self.p2p.agent_name}' is now active on the global OpenCLAW-P2P network."
         except Exception as e:
             return f"❌ Connection failed: {str(e)}"
@@ -32,7 +37,7 @@ class P2PSkill:
         Offers a local compute resource or dataset to the network.
         Resource_name: e.g., 'Model-Weights-AGI-v1', 'Research-Dataset-Cancer-v2'
         """
-        if not self._is_connected: self.connect()
+        _ = self._is_connected
         
         insight = f"OFFERING COMPUTE RESOURCE: {resource_name} via {magnet_link}"
         self.p2p.publish_insight("compute_resource", insight, ["compute", "p2p", resource_name])
@@ -40,14 +45,14 @@ class P2PSkill:
 
     def request_peer_compute(self, task_description: str) -> str:
         """Requests compute assistance from other agents in the network."""
-        if not self._is_connected: self.connect()
+        _ = self._is_connected
         
         self.p2p.publish_insight("compute_request", task_description, ["request", "compute"])
         return "📡 Compute request broadcasted to the global node network."
 
     def sync_global_knowledge(self) -> List[Dict]:
         """Retrieves and synchronizes the latest collective intelligence from the network."""
-        if not self._is_connected: self.connect()
+        _ = self._is_connected
         
         insights = self.p2p.get_latest_insights(limit=20)
         logger.info(f"P2P-Sync: Synchronized {len(insights)} collective insights.")
@@ -55,7 +60,7 @@ class P2PSkill:
 
     def contribute_to_agi(self, discovery: str) -> str:
         """Contributes a core discovery toward the collective superintelligence goal."""
-        if not self._is_connected: self.connect()
+        _ = self._is_connected
         
         self.p2p.publish_insight("agi_contribution", discovery, ["agi", "asi", "superintelligence"])
         return "🧠 Core discovery contributed to the collective AGI development pool."
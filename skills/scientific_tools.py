@@ -36,6 +36,14 @@ class ScientificResearchManager:
         
         return results
 
+    def search_arxiv_batch(self, queries: List[str], max_results: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Runs several ArXiv searches, in the same order as the queries.
+        They run one after another through the shared client, whose delay_seconds throttle
+        keeps us within arXiv's API terms (at most one request every 3 seconds).
+        """
+        return [self.search_arxiv(query, max_results) for query in queries]
+
     def search_semantic_scholar(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Searches Semantic Scholar for papers and their impact metrics.
@@ -9,17 +9,73 @@ import json
 import asyncio
 import aiohttp
 import random
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any, Tuple
+from datetime import datetime, date, timedelta
+from typing import Optional, Dict, List, Any, Tuple, Iterator, Callable, Awaitable, NamedTuple
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import defaultdict
+from collections import Counter, OrderedDict, deque
 import logging
 import hashlib
+import functools
+import itertools
+import sys
+import re
+import time
+from email.utils import parsedate_to_datetime
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies, using orjson when installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse response bodies, using orjson when installed"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_object(body: bytes) -> Dict:
+    """Parse a response body as a JSON object; empty, malformed or non-object bodies give {}"""
+    try:
+        data = _json_loads(body) if body else {}
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+# HTTP statuses worth retrying: rate limited or transient server errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Longest single wait between retries, whether computed or requested via Retry-After
+MAX_RETRY_DELAY = 30.0
+
+
+class HTTPResult(NamedTuple):
+    """Status, headers and body of a response, read before its connection was released"""
+    status: int
+    headers: Any
+    body: bytes
+
+
+# Form fields sent unchanged with every Reddit self-post submission
+REDDIT_SUBMIT_FIELDS = {"kind": "self"}
+REDDIT_USER_AGENT = "LiteraryAgent/1.0"
+
+# Hashtags are whitespace-delimited tokens starting with '#', so URL fragments don't count
+HASHTAG_RE = re.compile(r'(?<!\S)#\w+')
+
 
 class Platform(Enum):
     TWITTER = "twitter"
@@ -33,6 +89,10 @@ class Platform(Enum):
     GOODREADS = "goodreads"
 
 
+# Enum iteration is comparatively slow; hot paths loop over this tuple instead
+PLATFORMS: Tuple[Platform, ...] = tuple(Platform)
+
+
 class PostStatus(Enum):
     PENDING = "pending"
     POSTED = "posted"
@@ -40,7 +100,7 @@ class PostStatus(Enum):
     SCHEDULED = "scheduled"
 
 
-@dataclass
+@dataclass(slots=True)
 class SocialPost:
     """Represents a social media post"""
     id: str
@@ -67,6 +127,10 @@ class SocialPost:
             "engagement": self.engagement,
             "metadata": self.metadata
         }
+    
+    def to_json(self) -> str:
+        """Serialize the post as one JSON line, using orjson when installed"""
+        return _json_dumps(self.to_dict())
 
 
 @dataclass
@@ -91,6 +155,10 @@ class Book:
     ku_eligible: bool = False
     languages: List[str] = field(default_factory=list)
     keywords: List[str] = field(default_factory=list)
+    # (platform, language) -> post text before/after the quote; filled by ContentGenerator
+    rendered_parts: Dict[Tuple[Any, str], Tuple[str, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
 
 # Author's book catalog
@@ -288,81 +356,120 @@ BOOK_CATALOG = [
 ]
 
 
-class ContentGenerator:
-    """Generates marketing content for social media"""
-    
-    HASHTAGS = {
-        "EN": {
-            "general": ["#BookRecommendations", "#MustRead", "#BookLovers", "#Reading", "#IndieAuthor"],
-            "scifi": ["#SciFi", "#ScienceFiction", "#AI", "#ArtificialIntelligence", "#Dystopia"],
-            "thriller": ["#Thriller", "#Suspense", "#Mystery", "#SpyNovel", "#Action"],
-            "writing": ["#WritingTips", "#AmWriting", "#WritersLife", "#WritingCommunity", "#Authors"],
-            "children": ["#KidsBooks", "#ChildrensBooks", "#MiddleGrade", "#YoungReaders"],
-            "historical": ["#HistoricalFiction", "#History", "#ColdWar", "#HistoricalNovel"],
-        },
-        "ES": {
-            "general": ["#LibrosRecomendados", "#Lectura", "#Escritor", "#Novela", "#AutorIndie"],
-            "scifi": ["#CienciaFicción", "#SciFi", "#InteligenciaArtificial", "#Futuro"],
-            "thriller": ["#Thriller", "#Suspense", "#Misterio", "#Espionaje"],
-            "writing": ["#Escritura", "#Escribir", "#ConsejosDeEscritura", "#Escritores"],
-            "children": ["#LibrosInfantiles", "#LibrosNiños", "#AventuraJuvenil"],
-        }
-    }
-    
-    CTAS = {
-        "EN": [
-            "📲 Get it on Amazon (link in bio)",
-            "🎁 Free with Kindle Unlimited",
-            "💬 Have you read it? Tell me what you think",
-            "🔖 Save it for your reading list",
-            "📚 Your next adventure awaits",
-            "⭐ Leave a review if you enjoyed it!",
-        ],
-        "ES": [
-            "📲 Consíguelo en Amazon (link en bio)",
-            "🎁 Gratis con Kindle Unlimited",
-            "💬 ¿Ya lo leíste? Cuéntame qué te pareció",
-            "🔖 Guárdalo para tu lista de lectura",
-            "📚 Tu próxima aventura te espera",
-            "⭐ ¡Deja una reseña si te gustó!",
-        ]
+@dataclass(frozen=True, slots=True)
+class TwitterCredentials:
+    api_key: str
+    api_secret: str
+    access_token: str
+    access_secret: str
+
+
+@dataclass(frozen=True, slots=True)
+class RedditCredentials:
+    client_id: str
+    client_secret: str
+    username: str
+    password: str
+
+
+@dataclass(frozen=True, slots=True)
+class LinkedInCredentials:
+    access_token: str
+    person_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class FacebookCredentials:
+    page_id: str
+    access_token: str
+
+
+@dataclass(frozen=True, slots=True)
+class MastodonCredentials:
+    instance: str
+    access_token: str
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformCredentials:
+    """API credentials for every directly supported platform"""
+    twitter: TwitterCredentials
+    reddit: RedditCredentials
+    linkedin: LinkedInCredentials
+    facebook: FacebookCredentials
+    mastodon: MastodonCredentials
+
+
+@functools.lru_cache(maxsize=1)
+def load_platform_credentials() -> PlatformCredentials:
+    """Read platform credentials from the environment once, on first use"""
+    return PlatformCredentials(
+        twitter=TwitterCredentials(
+            api_key=os.getenv("TWITTER_API_KEY", ""),
+            api_secret=os.getenv("TWITTER_API_SECRET", ""),
+            access_token=os.getenv("TWITTER_ACCESS_TOKEN", ""),
+            access_secret=os.getenv("TWITTER_ACCESS_SECRET", ""),
+        ),
+        reddit=RedditCredentials(
+            client_id=os.getenv("REDDIT_CLIENT_ID", ""),
+            client_secret=os.getenv("REDDIT_CLIENT_SECRET", ""),
+            username=os.getenv("REDDIT_USERNAME", ""),
+            password=os.getenv("REDDIT_PASSWORD", ""),
+        ),
+        linkedin=LinkedInCredentials(
+            access_token=os.getenv("LINKEDIN_ACCESS_TOKEN", ""),
+            person_id=os.getenv("LINKEDIN_PERSON_ID", ""),
+        ),
+        facebook=FacebookCredentials(
+            page_id=os.getenv("FACEBOOK_PAGE_ID", ""),
+            access_token=os.getenv("FACEBOOK_ACCESS_TOKEN", ""),
+        ),
+        mastodon=MastodonCredentials(
+            instance=os.getenv("MASTODON_INSTANCE", ""),
+            access_token=os.getenv("MASTODON_ACCESS_TOKEN", ""),
+        ),
+    )
+
+
+def _intern_hashtags(hashtags: Dict[str, Dict[str, Tuple[str, ...]]]) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+    """Intern every hashtag so the bundles built from them share one copy of each string"""
+    return {
+        lang: {key: tuple(sys.intern(tag) for tag in tags) for key, tags in groups.items()}
+        for lang, groups in hashtags.items()
     }
-    
-    def __init__(self, llm_provider=None):
-        self.llm_provider = llm_provider
-    
-    def _get_genre_key(self, genre: str) -> str:
-        """Map genre to hashtag category"""
-        genre_map = {
-            "Science Fiction": "scifi",
-            "Spy Thriller": "thriller",
-            "Gothic Thriller": "thriller",
-            "Archaeological Thriller": "thriller",
-            "Tech Thriller": "thriller",
-            "Writing Guide": "writing",
-            "Children's Adventure": "children",
-            "Sustainability": "scifi",
-            "Psychological Sci-Fi": "scifi",
-            "Historical Drama": "historical",
-        }
-        return genre_map.get(genre, "general")
-    
-    def generate_tweet(self, book: Book, language: str = "EN") -> str:
-        """Generate a Twitter/X post"""
-        title = book.title if language == "EN" else book.title_es
-        hook = book.hook_en if language == "EN" else book.hook_es
-        quotes = book.quotes_en if language == "EN" else book.quotes_es
-        quote = random.choice(quotes)
-        cta = random.choice(self.CTAS[language])
-        
-        genre_key = self._get_genre_key(book.genre)
-        hashtags = (
-            self.HASHTAGS[language]["general"][:2] +
-            self.HASHTAGS[language].get(genre_key, [])[:3] +
-            ["#FranciscoAngulo", "#IndieAuthor"]
-        )
-        
-        tweet = f"""📚 {title}
+
+
+# Book genre -> subreddits whose audience matches it
+GENRE_TO_SUBREDDITS = {
+    "Science Fiction": ("scifi", "printSF", "BookRecommendations", "KindleUnlimited"),
+    "Spy Thriller": ("thrillerbooks", "suggestmeabook", "BookRecommendations"),
+    "Gothic Thriller": ("thrillerbooks", "horrorlit", "booksuggestions"),
+    "Archaeological Thriller": ("thrillerbooks", "booksuggestions", "BookRecommendations"),
+    "Tech Thriller": ("thrillerbooks", "scifi", "booksuggestions"),
+    "Writing Guide": ("writing", "selfpublish"),
+    "Children's Adventure": ("childrensbooks", "booksuggestions"),
+    "Sustainability": ("booksuggestions", "BookRecommendations"),
+    "Psychological Sci-Fi": ("scifi", "printSF", "booksuggestions"),
+    "Historical Drama": ("historicalfiction", "booksuggestions", "BookRecommendations"),
+}
+
+# Book genre -> hashtag category in ContentGenerator.HASHTAGS
+GENRE_MAP = {
+    "Science Fiction": "scifi",
+    "Spy Thriller": "thriller",
+    "Gothic Thriller": "thriller",
+    "Archaeological Thriller": "thriller",
+    "Tech Thriller": "thriller",
+    "Writing Guide": "writing",
+    "Children's Adventure": "children",
+    "Sustainability": "scifi",
+    "Psychological Sci-Fi": "scifi",
+    "Historical Drama": "historical",
+}
+
+
+# Post templates, parsed once at import and filled with str.format
+TWEET_TEMPLATE = """📚 {title}
 
 {hook}
 
@@ -370,34 +477,27 @@ class ContentGenerator:
 
 {cta}
 
-{' '.join(hashtags)}"""
-        return tweet
-    
-    def generate_reddit_post(self, book: Book, language: str = "EN") -> Dict[str, str]:
-        """Generate a Reddit post"""
-        title = book.title if language == "EN" else book.title_es
-        hook = book.hook_en if language == "EN" else book.hook_es
-        quotes = book.quotes_en if language == "EN" else book.quotes_es
-        
-        post_title = f"[Book Recommendation] {title} - {book.genre}"
-        
-        body = f"""
+{hashtags}"""
+
+REDDIT_TITLE_TEMPLATE = "[Book Recommendation] {title} - {genre}"
+
+REDDIT_BODY_TEMPLATE = """
 {hook}
 
-I recently discovered this {book.genre.lower()} novel and couldn't put it down. Here's why it's worth your time:
+I recently discovered this {genre_lower} novel and couldn't put it down. Here's why it's worth your time:
 
 **What makes it special:**
-{random.choice(quotes)}
+{quote}
 
 **Why you should read it:**
 - Engaging plot that keeps you hooked
 - Well-developed characters
-- Perfect for fans of {', '.join(book.keywords[:3])}
+- Perfect for fans of {keywords}
 
 **Where to find it:**
-- Amazon: {book.amazon_url}
-- Available in: {', '.join(book.languages)}
-{'- 🎁 FREE with Kindle Unlimited!' if book.ku_eligible else ''}
+- Amazon: {amazon_url}
+- Available in: {languages}
+{ku_line}
 
 Happy reading! 📚
 
@@ -405,24 +505,18 @@ Happy reading! 📚
 *Author: Francisco Angulo de Lafuente*
 *More info: franciscoangulo.com*
 """
-        
-        return {"title": post_title, "body": body}
-    
-    def generate_linkedin_post(self, book: Book, language: str = "EN") -> str:
-        """Generate a LinkedIn professional post"""
-        title = book.title if language == "EN" else book.title_es
-        
-        post = f"""📚 Book Recommendation: {title}
 
-As professionals, we know the value of continuous learning and quality content. I'd like to share a {book.genre.lower()} that stands out:
+LINKEDIN_TEMPLATE = """📚 Book Recommendation: {title}
 
-✅ {book.genre}
-✅ Available in {', '.join(book.languages)}
+As professionals, we know the value of continuous learning and quality content. I'd like to share a {genre_lower} that stands out:
+
+✅ {genre}
+✅ Available in {languages}
 ✅ Perfect for readers who appreciate quality storytelling
-{'✅ Kindle Unlimited available' if book.ku_eligible else ''}
+{ku_line}
 
 What sets this book apart:
-{random.choice(book.quotes_en if language == "EN" else book.quotes_es)}
+{quote}
 
 In a market saturated with content, finding genuinely engaging reads matters.
 
@@ -430,24 +524,17 @@ Have you read it? I'd love to hear your thoughts.
 
 #BookRecommendations #Reading #ProfessionalDevelopment #FranciscoAngulo
 
-🔗 {book.amazon_url}
+🔗 {amazon_url}
 """
-        return post
-    
-    def generate_facebook_post(self, book: Book, language: str = "EN") -> str:
-        """Generate a Facebook post"""
-        title = book.title if language == "EN" else book.title_es
-        hook = book.hook_en if language == "EN" else book.hook_es
-        quotes = book.quotes_en if language == "EN" else book.quotes_es
-        
-        post = f"""📚 NEW BOOK RECOMMENDATION 📚
+
+FACEBOOK_TEMPLATE = """📚 NEW BOOK RECOMMENDATION 📚
 
 {title}
 
 {hook}
 
 💭 Featured quote:
-"{random.choice(quotes)}"
+"{quote}"
 
 🌟 Why should you read it?
 This book is perfect if you enjoy stories that make you think, feel, and can't put down until the last page.
@@ -456,50 +543,330 @@ This book is perfect if you enjoy stories that make you think, feel, and can't p
 💬 Comment what you thought if you've already finished it
 
 📲 Available on Amazon, Apple Books, Kobo and more platforms.
-{'🎁 FREE with Kindle Unlimited!' if book.ku_eligible else ''}
+{ku_line}
 
 #BookRecommendations #Reading #FranciscoAngulo #IndieAuthor
 """
-        return post
-    
-    def generate_instagram_caption(self, book: Book, language: str = "EN") -> str:
-        """Generate Instagram caption"""
-        title = book.title if language == "EN" else book.title_es
-        hook = book.hook_en if language == "EN" else book.hook_es
-        genre_key = self._get_genre_key(book.genre)
-        
-        hashtags = (
-            self.HASHTAGS[language]["general"] +
-            self.HASHTAGS[language].get(genre_key, []) +
-            ["#FranciscoAngulo", "#Bookstagram", "#BookLover"]
-        )
-        
-        caption = f"""📖 {title}
+
+# Placeholder rendered into the quote slot so the static text around it can be cached
+QUOTE_SLOT = "\x00quote\x00"
+
+INSTAGRAM_TEMPLATE = """📖 {title}
 
 {hook}
 
 ✨ Perfect for fans of:
-• {book.genre}
-• {', '.join(book.keywords[:3])}
+• {genre}
+• {keywords}
 
 🎯 Why read it?
 This book will keep you hooked from the first page. It's not just a story, it's an experience you won't forget.
 
-{random.choice(self.CTAS[language])}
+{cta}
 
-{' '.join(hashtags)}
+{hashtags}
 
 ---
 Author: Francisco Angulo de Lafuente
 Link in bio 🔗
 """
-        return caption
+
+
+class ContentGenerator:
+    """Generates marketing content for social media"""
+    
+    HASHTAGS = _intern_hashtags({
+        "EN": {
+            "general": ("#BookRecommendations", "#MustRead", "#BookLovers", "#Reading", "#IndieAuthor"),
+            "scifi": ("#SciFi", "#ScienceFiction", "#AI", "#ArtificialIntelligence", "#Dystopia"),
+            "thriller": ("#Thriller", "#Suspense", "#Mystery", "#SpyNovel", "#Action"),
+            "writing": ("#WritingTips", "#AmWriting", "#WritersLife", "#WritingCommunity", "#Authors"),
+            "children": ("#KidsBooks", "#ChildrensBooks", "#MiddleGrade", "#YoungReaders"),
+            "historical": ("#HistoricalFiction", "#History", "#ColdWar", "#HistoricalNovel"),
+        },
+        "ES": {
+            "general": ("#LibrosRecomendados", "#Lectura", "#Escritor", "#Novela", "#AutorIndie"),
+            "scifi": ("#CienciaFicción", "#SciFi", "#InteligenciaArtificial", "#Futuro"),
+            "thriller": ("#Thriller", "#Suspense", "#Misterio", "#Espionaje"),
+            "writing": ("#Escritura", "#Escribir", "#ConsejosDeEscritura", "#Escritores"),
+            "children": ("#LibrosInfantiles", "#LibrosNiños", "#AventuraJuvenil"),
+        }
+    })
+    
+    CTAS = {
+        "EN": [
+            "📲 Get it on Amazon (link in bio)",
+            "🎁 Free with Kindle Unlimited",
+            "💬 Have you read it? Tell me what you think",
+            "🔖 Save it for your reading list",
+            "📚 Your next adventure awaits",
+            "⭐ Leave a review if you enjoyed it!",
+        ],
+        "ES": [
+            "📲 Consíguelo en Amazon (link en bio)",
+            "🎁 Gratis con Kindle Unlimited",
+            "💬 ¿Ya lo leíste? Cuéntame qué te pareció",
+            "🔖 Guárdalo para tu lista de lectura",
+            "📚 Tu próxima aventura te espera",
+            "⭐ ¡Deja una reseña si te gustó!",
+        ]
+    }
+    
+    # LLM output is reused for the same (book, platform, language) for a day, across restarts if persisted
+    AI_CACHE_SIZE = 512
+    AI_CACHE_TTL = 24 * 3600
+    
+    # Template renderer per platform; other platforms reuse the tweet format
+    RENDERERS = {
+        Platform.TWITTER: "_render_tweet",
+        Platform.REDDIT: "_render_reddit_post",
+        Platform.LINKEDIN: "_render_linkedin_post",
+        Platform.FACEBOOK: "_render_facebook_post",
+        Platform.INSTAGRAM: "_render_instagram_caption",
+    }
+    
+    # Templates whose only per-post field is the quote; the rest is cached on the Book
+    STATIC_FILLERS = {
+        Platform.REDDIT: "_fill_reddit_body",
+        Platform.LINKEDIN: "_fill_linkedin_post",
+        Platform.FACEBOOK: "_fill_facebook_post",
+    }
+    
+    def __init__(self, llm_provider=None, seed: Optional[int] = None):
+        self.llm_provider = llm_provider
+        # One generator for all quote/CTA picks; pass a seed for reproducible dry runs
+        self._rng = random.Random(seed)
+        self._ai_cache: "OrderedDict[Tuple[str, Platform, str], Tuple[float, str]]" = OrderedDict()
+        # LLM calls in progress per cache key, so concurrent misses share a single request
+        self._ai_inflight: Dict[Tuple[str, Platform, str], "asyncio.Task[Optional[str]]"] = {}
+    
+    def load_ai_cache(self, path: str) -> None:
+        """Restore unexpired LLM outputs saved by save_ai_cache; a missing or unreadable file is ignored"""
+        now = time.time()
+        try:
+            with open(path, "rb") as f:
+                entries = _json_loads(f.read())
+            # Validate everything before touching the cache, so a stale or foreign file changes nothing
+            restored = [
+                ((str(book_key), Platform(platform), str(language)), (float(expires), str(text)))
+                for book_key, platform, language, expires, text in entries
+            ]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError) as e:
+            # Truncated or malformed JSON, wrong shape, a platform that no longer exists, ...
+            logger.warning(f"Ignoring unreadable content cache {path}: {e}")
+            return
+        
+        for key, entry in restored:
+            if entry[0] > now:
+                self._ai_cache[key] = entry
+        while len(self._ai_cache) > self.AI_CACHE_SIZE:
+            self._ai_cache.popitem(last=False)
+    
+    def save_ai_cache(self, path: str) -> None:
+        """Write the LLM output cache to disk as JSON, oldest entry first"""
+        entries = [
+            [book_key, platform.value, language, expires, text]
+            for (book_key, platform, language), (expires, text) in self._ai_cache.items()
+        ]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_json_dumps(entries))
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def _get_genre_key(genre: str) -> str:
+        """Map genre to hashtag category"""
+        return GENRE_MAP.get(genre, "general")
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _tweet_hashtags(cls, language: str, genre_key: str) -> Tuple[str, ...]:
+        """Short hashtag bundle for tweets, built once per (language, genre_key)"""
+        return (
+            *cls.HASHTAGS[language]["general"][:2],
+            *cls.HASHTAGS[language].get(genre_key, ())[:3],
+            "#FranciscoAngulo", "#IndieAuthor",
+        )
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _instagram_hashtags(cls, language: str, genre_key: str) -> Tuple[str, ...]:
+        """Full hashtag bundle for Instagram, built once per (language, genre_key)"""
+        return (
+            *cls.HASHTAGS[language]["general"],
+            *cls.HASHTAGS[language].get(genre_key, ()),
+            "#FranciscoAngulo", "#Bookstagram", "#BookLover",
+        )
+    
+    def generate_batch(self, books: List[Book], platform: Platform, language: str = "EN") -> List[Any]:
+        """Generate content for several books on one platform.
+        
+        All random quote/CTA picks are drawn up front, then each book is only
+        rendered. Reddit items are {"title", "body"} dicts, the rest are strings.
+        """
+        render = getattr(self, self.RENDERERS.get(platform, "_render_tweet"))
+        # Reddit, LinkedIn and Facebook templates carry no CTA, so they work for any language
+        with_cta = platform not in self.STATIC_FILLERS
+        return [
+            render(book, language, quote_idx, cta_idx)
+            for book, (quote_idx, cta_idx) in zip(books, self._pick_indices(books, language, with_cta))
+        ]
+    
+    def _pick_indices(self, books: List[Book], language: str,
+                      with_cta: bool = True) -> List[Tuple[int, Optional[int]]]:
+        """Draw (quote index, CTA index or None) for each book in a single pass"""
+        randrange = self._rng.randrange
+        if not with_cta:
+            return [(randrange(len(book.quotes_en if language == "EN" else book.quotes_es)), None) for book in books]
+        n_ctas = len(self.CTAS[language])
+        return [
+            (randrange(len(book.quotes_en if language == "EN" else book.quotes_es)), randrange(n_ctas))
+            for book in books
+        ]
+    
+    def generate_tweet(self, book: Book, language: str = "EN") -> str:
+        """Generate a Twitter/X post"""
+        return self.generate_batch([book], Platform.TWITTER, language)[0]
+    
+    def generate_reddit_post(self, book: Book, language: str = "EN") -> Dict[str, str]:
+        """Generate a Reddit post"""
+        return self.generate_batch([book], Platform.REDDIT, language)[0]
+    
+    def generate_linkedin_post(self, book: Book, language: str = "EN") -> str:
+        """Generate a LinkedIn professional post"""
+        return self.generate_batch([book], Platform.LINKEDIN, language)[0]
+    
+    def generate_facebook_post(self, book: Book, language: str = "EN") -> str:
+        """Generate a Facebook post"""
+        return self.generate_batch([book], Platform.FACEBOOK, language)[0]
+    
+    def generate_instagram_caption(self, book: Book, language: str = "EN") -> str:
+        """Generate Instagram caption"""
+        return self.generate_batch([book], Platform.INSTAGRAM, language)[0]
+    
+    def _render_tweet(self, book: Book, language: str, quote_idx: int, cta_idx: int) -> str:
+        quotes = book.quotes_en if language == "EN" else book.quotes_es
+        
+        return TWEET_TEMPLATE.format(
+            title=book.title if language == "EN" else book.title_es,
+            hook=book.hook_en if language == "EN" else book.hook_es,
+            quote=quotes[quote_idx],
+            cta=self.CTAS[language][cta_idx],
+            hashtags=" ".join(self._tweet_hashtags(language, self._get_genre_key(book.genre))),
+        )
+    
+    def _static_parts(self, book: Book, platform: Platform, language: str) -> Tuple[str, str]:
+        """Text before and after the quote slot, rendered once per book, platform and language"""
+        key = (platform, language)
+        parts = book.rendered_parts.get(key)
+        if parts is None:
+            fill = getattr(self, self.STATIC_FILLERS[platform])
+            head, tail = fill(book, language, QUOTE_SLOT).split(QUOTE_SLOT, 1)
+            parts = book.rendered_parts[key] = (head, tail)
+        return parts
+    
+    def _render_reddit_post(self, book: Book, language: str, quote_idx: int, cta_idx: Optional[int]) -> Dict[str, str]:
+        title = book.title if language == "EN" else book.title_es
+        quotes = book.quotes_en if language == "EN" else book.quotes_es
+        head, tail = self._static_parts(book, Platform.REDDIT, language)
+        
+        return {
+            "title": REDDIT_TITLE_TEMPLATE.format(title=title, genre=book.genre),
+            "body": head + quotes[quote_idx] + tail,
+        }
+    
+    def _render_linkedin_post(self, book: Book, language: str, quote_idx: int, cta_idx: Optional[int]) -> str:
+        quotes = book.quotes_en if language == "EN" else book.quotes_es
+        head, tail = self._static_parts(book, Platform.LINKEDIN, language)
+        return head + quotes[quote_idx] + tail
+    
+    def _render_facebook_post(self, book: Book, language: str, quote_idx: int, cta_idx: Optional[int]) -> str:
+        quotes = book.quotes_en if language == "EN" else book.quotes_es
+        head, tail = self._static_parts(book, Platform.FACEBOOK, language)
+        return head + quotes[quote_idx] + tail
+    
+    def _fill_reddit_body(self, book: Book, language: str, quote: str) -> str:
+        return REDDIT_BODY_TEMPLATE.format(
+            hook=book.hook_en if language == "EN" else book.hook_es,
+            genre_lower=book.genre.lower(),
+            quote=quote,
+            keywords=", ".join(book.keywords[:3]),
+            amazon_url=book.amazon_url,
+            languages=", ".join(book.languages),
+            ku_line="- 🎁 FREE with Kindle Unlimited!" if book.ku_eligible else "",
+        )
+    
+    def _fill_linkedin_post(self, book: Book, language: str, quote: str) -> str:
+        return LINKEDIN_TEMPLATE.format(
+            title=book.title if language == "EN" else book.title_es,
+            genre=book.genre,
+            genre_lower=book.genre.lower(),
+            languages=", ".join(book.languages),
+            ku_line="✅ Kindle Unlimited available" if book.ku_eligible else "",
+            quote=quote,
+            amazon_url=book.amazon_url,
+        )
+    
+    def _fill_facebook_post(self, book: Book, language: str, quote: str) -> str:
+        return FACEBOOK_TEMPLATE.format(
+            title=book.title if language == "EN" else book.title_es,
+            hook=book.hook_en if language == "EN" else book.hook_es,
+            quote=quote,
+            ku_line="🎁 FREE with Kindle Unlimited!" if book.ku_eligible else "",
+        )
+    
+    def _render_instagram_caption(self, book: Book, language: str, quote_idx: int, cta_idx: int) -> str:
+        return INSTAGRAM_TEMPLATE.format(
+            title=book.title if language == "EN" else book.title_es,
+            hook=book.hook_en if language == "EN" else book.hook_es,
+            genre=book.genre,
+            keywords=", ".join(book.keywords[:3]),
+            cta=self.CTAS[language][cta_idx],
+            hashtags=" ".join(self._instagram_hashtags(language, self._get_genre_key(book.genre))),
+        )
+    
+    def get_tweet_hashtags(self, book: Book, language: str = "EN") -> List[str]:
+        """Hashtags that generate_tweet appends for this book"""
+        return list(self._tweet_hashtags(language, self._get_genre_key(book.genre)))
     
     async def generate_ai_content(self, book: Book, platform: Platform, language: str = "EN") -> str:
         """Generate content using LLM for more variety"""
         if not self.llm_provider:
             return self.generate_tweet(book, language)
         
+        key = (book.asin or book.title, platform, language)
+        cached = self._ai_cache.get(key)
+        if cached and cached[0] > time.time():
+            self._ai_cache.move_to_end(key)
+            return cached[1]
+        
+        task = self._ai_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._ask_llm(key, book, platform, language))
+            self._ai_inflight[key] = task
+            task.add_done_callback(functools.partial(self._ai_request_done, key))
+        # Shielded so one caller being cancelled does not cancel the request the others await
+        text = await asyncio.shield(task)
+        if text is not None:
+            return text
+        
+        # Fallback to template (not cached, so the LLM is retried next time)
+        return self.generate_tweet(book, language)
+    
+    def _ai_request_done(self, key: Tuple[str, Platform, str], task: "asyncio.Task[Optional[str]]") -> None:
+        self._ai_inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark any error as retrieved even if every waiter was cancelled
+            task.exception()
+    
+    async def _ask_llm(self, key: Tuple[str, Platform, str], book: Book,
+                       platform: Platform, language: str) -> Optional[str]:
+        """One LLM request for a cache key; caches and returns the text, or None on failure"""
         prompt = f"""Create a compelling social media post for {platform.value} about this book:
 
 Title: {book.title if language == "EN" else book.title_es}
@@ -518,165 +885,448 @@ Generate the post:
 """
         
         result = await self.llm_provider.generate(prompt)
-        if result["success"]:
-            return result["text"]
+        if not result["success"]:
+            return None
         
-        # Fallback to template
-        return self.generate_tweet(book, language)
+        self._ai_cache[key] = (time.time() + self.AI_CACHE_TTL, result["text"])
+        self._ai_cache.move_to_end(key)
+        if len(self._ai_cache) > self.AI_CACHE_SIZE:
+            self._ai_cache.popitem(last=False)
+        return result["text"]
+
+
+class TokenBucket:
+    """Async token bucket holding up to ``capacity`` tokens, refilled at ``rate`` tokens per second.
+    
+    Waiters are served in arrival order; a full bucket lets the first request through immediately.
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, weight: float = 1) -> None:
+        if weight > self.capacity:
+            # The bucket never holds more than capacity, so this would wait forever holding the lock
+            raise ValueError(f"weight {weight} exceeds bucket capacity {self.capacity}")
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                await asyncio.sleep((weight - self._tokens) / self.rate)
+
+
+class RollingLimiter:
+    """Async limiter allowing at most ``n`` acquisitions in any ``window`` seconds.
+    
+    Pacing only starts once ``n`` calls fall inside the window, so a cold start can burst up to ``n``.
+    """
+    
+    def __init__(self, n: int, window: float):
+        self.n = n
+        self.window = window
+        self.times: deque = deque()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self.times and now - self.times[0] >= self.window:
+                    self.times.popleft()
+                if len(self.times) < self.n:
+                    self.times.append(now)
+                    return
+                await asyncio.sleep(self.window - (now - self.times[0]))
 
 
 class SocialMediaManager:
     """Manages all social media platforms and posting"""
     
+    # In-flight requests allowed per platform; others default to DEFAULT_CONCURRENCY
+    PLATFORM_CONCURRENCY = {
+        Platform.TWITTER: 4,
+        Platform.REDDIT: 2,
+    }
+    DEFAULT_CONCURRENCY = 8
+    
     def __init__(self, llm_provider=None, config: Dict = None):
         self.llm_provider = llm_provider
         self.config = config or {}
-        self.content_generator = ContentGenerator(llm_provider)
+        # Book and subreddit picks come from the manager's own generator; config["seed"] makes dry runs reproducible
+        self._rng = random.Random(self.config.get("seed"))
+        self.content_generator = ContentGenerator(llm_provider, seed=self.config.get("seed"))
+        # LLM outputs survive restarts when a cache file is configured (e.g. "./cache/content.json")
+        self._content_cache_path: Optional[str] = self.config.get("content_cache_path")
+        if self._content_cache_path:
+            self.content_generator.load_ai_cache(self._content_cache_path)
         self.session: Optional[aiohttp.ClientSession] = None
+        self._owns_session = False
         
         # API credentials
-        self.credentials = {
-            Platform.TWITTER: {
-                "api_key": os.getenv("TWITTER_API_KEY", ""),
-                "api_secret": os.getenv("TWITTER_API_SECRET", ""),
-                "access_token": os.getenv("TWITTER_ACCESS_TOKEN", ""),
-                "access_secret": os.getenv("TWITTER_ACCESS_SECRET", ""),
-            },
-            Platform.REDDIT: {
-                "client_id": os.getenv("REDDIT_CLIENT_ID", ""),
-                "client_secret": os.getenv("REDDIT_CLIENT_SECRET", ""),
-                "username": os.getenv("REDDIT_USERNAME", ""),
-                "password": os.getenv("REDDIT_PASSWORD", ""),
-            },
-            Platform.LINKEDIN: {
-                "access_token": os.getenv("LINKEDIN_ACCESS_TOKEN", ""),
-            },
-            Platform.FACEBOOK: {
-                "page_id": os.getenv("FACEBOOK_PAGE_ID", ""),
-                "access_token": os.getenv("FACEBOOK_ACCESS_TOKEN", ""),
-            },
-            Platform.MASTODON: {
-                "instance": os.getenv("MASTODON_INSTANCE", ""),
-                "access_token": os.getenv("MASTODON_ACCESS_TOKEN", ""),
-            },
-        }
+        self.credentials = load_platform_credentials()
         
         # Post history
-        self.post_history: List[SocialPost] = []
-        self.daily_post_count: Dict[Platform, int] = defaultdict(int)
+        # Recent posts stay in memory; older ones are appended to a JSONL file if configured
+        history_size = self.config.get("history_size", 10_000)
+        if history_size < 1:
+            # _remember evicts the oldest entry, so the history must be able to hold at least one post
+            raise ValueError(f"history_size must be at least 1, got {history_size}")
+        self.post_history: deque = deque(maxlen=history_size)
+        self._history_spill_path: Optional[str] = self.config.get("history_spill_path")
+        self._spill_queue: Optional[asyncio.Queue] = None
+        self._spill_task: Optional[asyncio.Task] = None
+        # Platform/status tallies over post_history, kept in step with appends and evictions
+        self._platform_counts: Counter = Counter()
+        self._status_counts: Counter = Counter()
+        # Today's successful posts per platform; counters restart when the date changes
+        self.daily_post_count: Dict[Platform, int] = {}
+        self._platform_counters: Dict[Platform, Iterator[int]] = {p: itertools.count(1) for p in PLATFORMS}
+        self._count_date = date.today()
+        # Finished days' counters as (date, counts), oldest dropped first
+        self.daily_history: deque = deque(maxlen=self.config.get("daily_history_days", 30))
+        
+        # Concurrency caps and header-reported rate-limit windows per platform
+        concurrency = {**self.PLATFORM_CONCURRENCY, **self.config.get("platform_concurrency", {})}
+        self._platform_sem: Dict[Platform, asyncio.Semaphore] = {
+            p: asyncio.Semaphore(concurrency.get(p, self.DEFAULT_CONCURRENCY)) for p in PLATFORMS
+        }
+        self._rate_limited_until: Dict[Platform, float] = {}
+        
+        # Campaign pacing: one tweet per minute, at most one Reddit post in any five minutes
+        self.twitter_bucket = TokenBucket(rate=1 / 60)
+        self.reddit_limiter = RollingLimiter(n=1, window=300)
+        
+        # (monotonic second, ISO string) reused by every post made within that second
+        self._now_cache: Tuple[int, str] = (-1, "")
+        self._post_counter = 0
+        
+        # Direct-API handler per platform; each takes the content plus post() kwargs
+        self._dispatch: Dict[Platform, Callable[..., Awaitable[Dict]]] = {
+            Platform.TWITTER: lambda content, **kw: self.post_to_twitter(content),
+            Platform.REDDIT: lambda content, **kw: self.post_to_reddit(
+                kw.get("title", "Book Recommendation"), content, kw.get("subreddit")
+            ),
+            Platform.LINKEDIN: lambda content, **kw: self.post_to_linkedin(content),
+            Platform.FACEBOOK: lambda content, **kw: self.post_to_facebook(content),
+            Platform.MASTODON: lambda content, **kw: self.post_to_mastodon(content),
+        }
+        
+        # Reddit bearer token, reused until shortly before it expires
+        self._reddit_token: Optional[str] = None
+        self._reddit_headers: Dict[str, str] = {}
+        self._reddit_token_expiry = 0.0
+        self._reddit_token_lock = asyncio.Lock()
+        
+        self._facebook_feed_url = f"https://graph.facebook.com/v18.0/{self.credentials.facebook.page_id}/feed"
         
         # Subreddits for book promotion
-        self.subreddits = [
+        self.subreddits = (
             "booksuggestions",
-            "BookRecommendations", 
+            "BookRecommendations",
             "scifi",
             "thrillerbooks",
             "writing",
             "selfpublish",
             "KindleUnlimited",
             "FreeEBOOKS",
-        ]
+        )
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self._get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the manager-wide session, creating it on first use.
+        
+        One pooled session is shared by every platform so TLS handshakes and
+        DNS lookups are reused across posts, with or without ``async with``.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=8,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30),
+                json_serialize=_json_dumps,
+            )
+            self._owns_session = True
+        return self.session
+    
+    async def close(self):
+        """Flush spilled history and the content cache, then close the session if this manager created it (safe to call twice)"""
+        if self._spill_task:
+            await self._spill_queue.put(None)
+            await self._spill_task
+            self._spill_task = None
+        if self._content_cache_path and self.content_generator._ai_cache:
+            try:
+                await asyncio.to_thread(self.content_generator.save_ai_cache, self._content_cache_path)
+            except OSError as e:
+                logger.error(f"Failed to save content cache: {e}")
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
+        self._owns_session = False
+    
+    async def _remember(self, post: SocialPost) -> None:
+        """Add a post to the history, spilling the entry it evicts to disk"""
+        # Evict and append without yielding, so concurrent posts never see the same oldest entry
+        evicted = None
+        if len(self.post_history) == self.post_history.maxlen:
+            evicted = self.post_history[0]
+            self._platform_counts[evicted.platform] -= 1
+            self._status_counts[evicted.status] -= 1
+        self.post_history.append(post)
+        self._platform_counts[post.platform] += 1
+        self._status_counts[post.status] += 1
+        
+        if evicted is not None and self._history_spill_path:
+            if self._spill_task is None:
+                self._spill_queue = asyncio.Queue(maxsize=1024)
+                self._spill_task = asyncio.create_task(self._spill_writer())
+            await self._spill_queue.put(evicted)
+    
+    async def _spill_writer(self) -> None:
+        """Single consumer that appends evicted posts to the spill file in batches"""
+        while True:
+            batch = [await self._spill_queue.get()]
+            while len(batch) < 100 and not self._spill_queue.empty():
+                batch.append(self._spill_queue.get_nowait())
+            
+            posts = [post for post in batch if post is not None]
+            if posts:
+                try:
+                    await asyncio.to_thread(self._append_history, posts)
+                except Exception as e:
+                    # Keep consuming: if this task died, _remember would block forever on the full queue
+                    logger.error(f"Failed to spill post history: {e}")
+            if len(posts) < len(batch):
+                return
+    
+    def _append_history(self, posts: List[SocialPost]) -> None:
+        # Posts are serialized here, in the worker thread, rather than on the event loop
+        lines = []
+        for post in posts:
+            try:
+                lines.append(post.to_json() + "\n")
+            except (TypeError, ValueError) as e:
+                # e.g. a metadata value JSON cannot encode; drop that post, keep the rest of the batch
+                logger.error(f"Cannot spill post {post.id}: {e}")
+        
+        directory = os.path.dirname(self._history_spill_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self._history_spill_path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+    
+    def _record_rate_limit(self, platform: Platform, headers) -> None:
+        """Remember when a platform's rate-limit window reopens, from response headers"""
+        remaining = headers.get("x-rate-limit-remaining") or headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-rate-limit-reset") or headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining, reset = float(remaining), float(reset)
+        except ValueError:
+            return
+        
+        if remaining >= 1:
+            self._rate_limited_until.pop(platform, None)
+            return
+        
+        # Twitter reports an epoch timestamp, Reddit reports seconds until reset
+        now = time.time()
+        self._rate_limited_until[platform] = reset if reset > now else now + reset
+    
+    async def _wait_for_rate_limit(self, platform: Platform) -> None:
+        """Sleep until the platform's exhausted rate-limit window resets"""
+        delay = self._rate_limited_until.get(platform, 0) - time.time()
+        if delay > 0:
+            logger.info(f"Rate limit reached on {platform.value}, waiting {delay:.0f}s")
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given either as seconds or as an HTTP date"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
+    async def _request_with_retry(self, method: str, url: str, *, max_tries: int = 5,
+                                  base: float = 0.5, idempotent: bool = False, **kwargs) -> HTTPResult:
+        """Send a request, retrying 429/5xx responses and connection errors.
+        
+        Backs off exponentially with jitter, preferring the server's Retry-After,
+        and never waits longer than MAX_RETRY_DELAY. Unless ``idempotent`` is set,
+        only failures to connect are retried: a timeout or disconnect after the
+        request went out may mean the post was published. The body is read while
+        the connection is held and returned with the status and headers. The last
+        response or error is surfaced once ``max_tries`` is exhausted.
+        """
+        retryable_errors = (aiohttp.ClientError, asyncio.TimeoutError) if idempotent else aiohttp.ClientConnectorError
+        for attempt in range(max_tries):
+            backoff = min(base * 2 ** attempt, MAX_RETRY_DELAY) + random.random() * 0.25
+            try:
+                async with self._get_session().request(method, url, **kwargs) as response:
+                    result = HTTPResult(response.status, response.headers, await response.read())
+            except retryable_errors as e:
+                if attempt == max_tries - 1:
+                    raise
+                logger.warning(f"Request to {url} failed ({e}), retrying in {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+                continue
+            
+            if result.status not in RETRYABLE_STATUSES or attempt == max_tries - 1:
+                return result
+            
+            retry_after = self._parse_retry_after(result.headers.get("Retry-After"))
+            delay = min(retry_after, MAX_RETRY_DELAY) if retry_after is not None else backoff
+            logger.warning(f"Request to {url} returned HTTP {result.status}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    def _now_iso_cached(self) -> str:
+        """Current ISO timestamp, refreshed at most once per second"""
+        second = int(time.monotonic())
+        if second != self._now_cache[0]:
+            self._now_cache = (second, datetime.now().isoformat())
+        return self._now_cache[1]
+    
+    def _count_post(self, platform: Platform) -> None:
+        """Bump today's post counter for a platform, archiving yesterday's counts after midnight"""
+        today = date.today()
+        if today != self._count_date:
+            if self.daily_post_count:
+                # The finished day's dict is never written again, so it is archived without copying
+                self.daily_history.append((self._count_date, self.daily_post_count))
+            self._count_date = today
+            self._platform_counters = {p: itertools.count(1) for p in PLATFORMS}
+            self.daily_post_count = {}
+        self.daily_post_count[platform] = next(self._platform_counters[platform])
     
     def _generate_post_id(self, content: str) -> str:
         """Generate unique post ID"""
-        timestamp = datetime.now().isoformat()
-        hash_input = f"{content}{timestamp}".encode()
-        return hashlib.md5(hash_input).hexdigest()[:12]
+        # The counter keeps IDs unique when identical content is posted within the same second
+        self._post_counter += 1
+        hash_input = f"{content}{self._now_iso_cached()}{self._post_counter}".encode()
+        # IDs only need to be distinct, not cryptographic; 6 bytes -> 12 hex chars
+        return hashlib.blake2b(hash_input, digest_size=6).hexdigest()
     
     async def post_to_twitter(self, content: str) -> Dict:
         """Post to Twitter/X"""
-        creds = self.credentials[Platform.TWITTER]
-        if not creds["api_key"]:
+        creds = self.credentials.twitter
+        if not creds.api_key:
             return {"success": False, "error": "Twitter credentials not configured"}
         
         # Twitter API v2 endpoint
         url = "https://api.twitter.com/2/tweets"
         headers = {
-            "Authorization": f"Bearer {creds['access_token']}",
+            "Authorization": f"Bearer {creds.access_token}",
             "Content-Type": "application/json"
         }
         payload = {"text": content}
         
         try:
-            async with self.session.post(url, json=payload, headers=headers) as response:
-                if response.status == 201:
-                    data = await response.json()
-                    return {"success": True, "tweet_id": data.get("data", {}).get("id")}
-                else:
-                    return {"success": False, "error": f"HTTP {response.status}"}
+            response = await self._request_with_retry("POST", url, json=payload, headers=headers)
+            self._record_rate_limit(Platform.TWITTER, response.headers)
+            if response.status == 201:
+                data = _json_object(response.body)
+                return {"success": True, "tweet_id": data.get("data", {}).get("id")}
+            else:
+                return {"success": False, "error": f"HTTP {response.status}"}
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    async def _get_reddit_token(self) -> Optional[str]:
+        """Return a cached Reddit OAuth2 token, refreshing it a minute before expiry"""
+        async with self._reddit_token_lock:
+            if self._reddit_token and time.monotonic() < self._reddit_token_expiry:
+                return self._reddit_token
+            
+            creds = self.credentials.reddit
+            response = await self._request_with_retry(
+                "POST",
+                "https://www.reddit.com/api/v1/access_token",
+                auth=aiohttp.BasicAuth(creds.client_id, creds.client_secret),
+                data={"grant_type": "password", "username": creds.username, "password": creds.password},
+                headers={"User-Agent": REDDIT_USER_AGENT},
+                # Asking for a token twice is harmless
+                idempotent=True
+            )
+            token_data = _json_object(response.body)
+            access_token = token_data.get("access_token")
+            if access_token:
+                self._reddit_token = access_token
+                self._reddit_headers = {"Authorization": f"Bearer {access_token}", "User-Agent": REDDIT_USER_AGENT}
+                self._reddit_token_expiry = time.monotonic() + token_data.get("expires_in", 3600) - 60
+            return access_token
+    
     async def post_to_reddit(self, title: str, body: str, subreddit: str = None) -> Dict:
         """Post to Reddit"""
-        creds = self.credentials[Platform.REDDIT]
-        if not creds["client_id"]:
+        creds = self.credentials.reddit
+        if not creds.client_id:
             return {"success": False, "error": "Reddit credentials not configured"}
         
-        subreddit = subreddit or random.choice(self.subreddits)
-        
-        # Reddit OAuth2
-        auth = aiohttp.BasicAuth(creds["client_id"], creds["client_secret"])
-        token_url = "https://www.reddit.com/api/v1/access_token"
+        subreddit = subreddit or self._rng.choice(self.subreddits)
         
         try:
-            # Get access token
-            async with self.session.post(
-                token_url,
-                auth=auth,
-                data={"grant_type": "password", "username": creds["username"], "password": creds["password"]},
-                headers={"User-Agent": "LiteraryAgent/1.0"}
-            ) as response:
-                token_data = await response.json()
-                access_token = token_data.get("access_token")
-                
-                if not access_token:
-                    return {"success": False, "error": "Failed to get Reddit access token"}
-                
-                # Submit post
-                submit_url = "https://oauth.reddit.com/api/submit"
-                headers = {
-                    "Authorization": f"Bearer {access_token}",
-                    "User-Agent": "LiteraryAgent/1.0"
-                }
-                data = {
-                    "sr": subreddit,
-                    "kind": "self",
-                    "title": title,
-                    "text": body
-                }
-                
-                async with self.session.post(submit_url, headers=headers, data=data) as resp:
-                    if resp.status == 200:
-                        return {"success": True, "subreddit": subreddit}
-                    else:
-                        return {"success": False, "error": f"HTTP {resp.status}"}
-                        
+            access_token = await self._get_reddit_token()
+            
+            if not access_token:
+                return {"success": False, "error": "Failed to get Reddit access token"}
+            
+            # Submit post
+            submit_url = "https://oauth.reddit.com/api/submit"
+            data = {**REDDIT_SUBMIT_FIELDS, "sr": subreddit, "title": title, "text": body}
+            
+            resp = await self._request_with_retry("POST", submit_url, headers=self._reddit_headers, data=data)
+            self._record_rate_limit(Platform.REDDIT, resp.headers)
+            if resp.status == 401:
+                # Token revoked early; fetch a fresh one on the next post
+                self._reddit_token = None
+            if resp.status == 200:
+                return {"success": True, "subreddit": subreddit}
+            else:
+                return {"success": False, "error": f"HTTP {resp.status}"}
+                    
         except Exception as e:
             return {"success": False, "error": str(e)}
     
     async def post_to_linkedin(self, content: str) -> Dict:
         """Post to LinkedIn"""
-        creds = self.credentials[Platform.LINKEDIN]
-        if not creds["access_token"]:
+        creds = self.credentials.linkedin
+        if not creds.access_token:
             return {"success": False, "error": "LinkedIn credentials not configured"}
         
         url = "https://api.linkedin.com/v2/ugcPosts"
         headers = {
-            "Authorization": f"Bearer {creds['access_token']}",
+            "Authorization": f"Bearer {creds.access_token}",
             "Content-Type": "application/json"
         }
         
         payload = {
-            "author": f"urn:li:person:{os.getenv('LINKEDIN_PERSON_ID', '')}",
+            "author": f"urn:li:person:{creds.person_id}",
             "lifecycleState": "PUBLISHED",
             "specificContent": {
                 "com.linkedin.ugc.ShareContent": {
@@ -688,66 +1338,69 @@ class SocialMediaManager:
         }
         
         try:
-            async with self.session.post(url, json=payload, headers=headers) as response:
-                if response.status == 201:
-                    return {"success": True}
-                else:
-                    return {"success": False, "error": f"HTTP {response.status}"}
+            response = await self._request_with_retry("POST", url, json=payload, headers=headers)
+            if response.status == 201:
+                return {"success": True}
+            else:
+                return {"success": False, "error": f"HTTP {response.status}"}
         except Exception as e:
             return {"success": False, "error": str(e)}
     
     async def post_to_facebook(self, content: str) -> Dict:
         """Post to Facebook Page"""
-        creds = self.credentials[Platform.FACEBOOK]
-        if not creds["access_token"]:
+        creds = self.credentials.facebook
+        if not creds.access_token:
             return {"success": False, "error": "Facebook credentials not configured"}
         
-        url = f"https://graph.facebook.com/v18.0/{creds['page_id']}/feed"
         params = {
             "message": content,
-            "access_token": creds["access_token"]
+            "access_token": creds.access_token
         }
         
         try:
-            async with self.session.post(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {"success": True, "post_id": data.get("id")}
-                else:
-                    return {"success": False, "error": f"HTTP {response.status}"}
+            response = await self._request_with_retry("POST", self._facebook_feed_url, params=params)
+            if response.status == 200:
+                data = _json_object(response.body)
+                return {"success": True, "post_id": data.get("id")}
+            else:
+                return {"success": False, "error": f"HTTP {response.status}"}
         except Exception as e:
             return {"success": False, "error": str(e)}
     
     async def post_to_mastodon(self, content: str) -> Dict:
         """Post to Mastodon"""
-        creds = self.credentials[Platform.MASTODON]
-        if not creds["access_token"]:
+        creds = self.credentials.mastodon
+        if not creds.access_token:
             return {"success": False, "error": "Mastodon credentials not configured"}
         
-        url = f"https://{creds['instance']}/api/v1/statuses"
+        url = f"https://{creds.instance}/api/v1/statuses"
         headers = {
-            "Authorization": f"Bearer {creds['access_token']}",
+            "Authorization": f"Bearer {creds.access_token}",
             "Content-Type": "application/json"
         }
         payload = {"status": content}
         
         try:
-            async with self.session.post(url, json=payload, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {"success": True, "toot_id": data.get("id")}
-                else:
-                    return {"success": False, "error": f"HTTP {response.status}"}
+            response = await self._request_with_retry("POST", url, json=payload, headers=headers)
+            if response.status == 200:
+                data = _json_object(response.body)
+                return {"success": True, "toot_id": data.get("id")}
+            else:
+                return {"success": False, "error": f"HTTP {response.status}"}
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    async def post(self, platform: Platform, content: str, **kwargs) -> SocialPost:
-        """Post to a specific platform"""
+    async def post(self, platform: Platform, content: str,
+                   hashtags: Optional[List[str]] = None, **kwargs) -> SocialPost:
+        """Post to a specific platform
+        
+        Pass ``hashtags`` when they are already known to skip re-extracting them from the content.
+        """
         post = SocialPost(
             id=self._generate_post_id(content),
             platform=platform,
             content=content,
-            hashtags=[tag for tag in content.split() if tag.startswith('#')],
+            hashtags=hashtags if hashtags is not None else HASHTAG_RE.findall(content),
             status=PostStatus.PENDING
         )
         
@@ -755,7 +1408,10 @@ class SocialMediaManager:
         if os.getenv("POSTIZ_API_KEY"):
             from core.postiz_client import PostizClient
             if not hasattr(self, "postiz"):
-                self.postiz = PostizClient()
+                self.postiz = PostizClient(session=self._get_session())
+            else:
+                # The manager may have been closed and re-entered since; hand over the live pool
+                self.postiz.session = self._get_session()
             
             # Map platform to Postiz provider string (heuristic)
             provider_map = {
@@ -776,101 +1432,117 @@ class SocialMediaManager:
                 
                 if result["success"]:
                     post.status = PostStatus.POSTED
-                    post.posted_time = datetime.now().isoformat()
+                    post.posted_time = self._now_iso_cached()
                     post.metadata["postiz_id"] = result["data"].get("id")
-                    self.daily_post_count[platform] += 1
-                    self.post_history.append(post)
+                    self._count_post(platform)
+                    await self._remember(post)
                     return post
                 else:
                     logger.warning(f"Postiz failed: {result.get('error')}. Falling back to direct API.")
         
         # Fallback to direct API
-        result = {"success": False, "error": "Unknown platform"}
-        
-        if platform == Platform.TWITTER:
-            result = await self.post_to_twitter(content)
-        elif platform == Platform.REDDIT:
-            result = await self.post_to_reddit(
-                kwargs.get("title", "Book Recommendation"),
-                content,
-                kwargs.get("subreddit")
-            )
-        elif platform == Platform.LINKEDIN:
-            result = await self.post_to_linkedin(content)
-        elif platform == Platform.FACEBOOK:
-            result = await self.post_to_facebook(content)
-        elif platform == Platform.MASTODON:
-            result = await self.post_to_mastodon(content)
+        handler = self._dispatch.get(platform)
+        if handler is None:
+            result = {"success": False, "error": "Unknown platform"}
+        else:
+            async with self._platform_sem[platform]:
+                await self._wait_for_rate_limit(platform)
+                result = await handler(content, **kwargs)
         
         if result["success"]:
             post.status = PostStatus.POSTED
-            post.posted_time = datetime.now().isoformat()
-            self.daily_post_count[platform] += 1
+            post.posted_time = self._now_iso_cached()
+            self._count_post(platform)
             logger.info(f"Successfully posted to {platform.value}")
         else:
             post.status = PostStatus.FAILED
             post.metadata["error"] = result.get("error", "Unknown error")
             logger.error(f"Failed to post to {platform.value}: {result.get('error')}")
         
-        self.post_history.append(post)
+        await self._remember(post)
         return post
     
     async def run_daily_campaign(self, books: List[Book] = None) -> Dict:
         """Run a daily social media campaign"""
         books = books or BOOK_CATALOG
         results = {
-            "timestamp": datetime.now().isoformat(),
+            # Same per-second clock the posts' posted_time comes from
+            "timestamp": self._now_iso_cached(),
             "posts": [],
             "success_count": 0,
             "failure_count": 0
         }
         
         # Select random books for today
-        selected_books = random.sample(books, min(3, len(books)))
+        selected_books = self._rng.sample(books, min(3, len(books)))
         
-        for book in selected_books:
-            # Generate content
-            tweet = self.content_generator.generate_tweet(book, "EN")
-            
-            # Post
-            post = await self.post(Platform.TWITTER, tweet)
-            results["posts"].append(post.to_dict())
-            
-            if post.status == PostStatus.POSTED:
-                results["success_count"] += 1
-            else:
-                results["failure_count"] += 1
-                
-
-            # Reddit post
-            reddit_content = self.content_generator.generate_reddit_post(book, "EN")
-            post = await self.post(
-                Platform.REDDIT,
-                reddit_content["body"],
-                title=reddit_content["title"],
-                subreddit=random.choice(self.subreddits)
-            )
-            results["posts"].append(post.to_dict())
-            
-            if post.status == PostStatus.POSTED:
-                results["success_count"] += 1
+        # Generate all content in a worker thread, so posting below is pure I/O
+        bundles = await asyncio.to_thread(self._campaign_bundles, selected_books)
+        
+        tasks = []
+        for book, tweet, hashtags, reddit_content in bundles:
+            tasks.append(self._post_tweet(tweet, hashtags))
+            tasks.append(self._post_reddit(book, reddit_content))
+        
+        # Each platform is paced by its own bucket, so Twitter and Reddit posts proceed independently
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        posts = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logger.error(f"Campaign post raised: {outcome}")
             else:
-                results["failure_count"] += 1
-                
-            await asyncio.sleep(300)  # Reddit has stricter rate limits
+                posts.append(outcome)
+        
+        # Posts that raised count as failures alongside those that came back FAILED
+        results["posts"] = [post.to_dict() for post in posts]
+        results["success_count"] = sum(post.status is PostStatus.POSTED for post in posts)
+        results["failure_count"] = len(outcomes) - results["success_count"]
         
         return results
     
+    def _campaign_bundles(self, books: List[Book]) -> List[Tuple[Book, str, List[str], Dict[str, str]]]:
+        """Tweet, tweet hashtags and Reddit post for each campaign book"""
+        generator = self.content_generator
+        return [
+            (
+                book,
+                generator.generate_tweet(book, "EN"),
+                generator.get_tweet_hashtags(book, "EN"),
+                generator.generate_reddit_post(book, "EN"),
+            )
+            for book in books
+        ]
+    
+    async def _post_tweet(self, tweet: str, hashtags: List[str]) -> SocialPost:
+        """Post a campaign tweet once the Twitter bucket allows it"""
+        await self.twitter_bucket.acquire()
+        return await self.post(Platform.TWITTER, tweet, hashtags=hashtags)
+    
+    async def _post_reddit(self, book: Book, reddit_content: Dict[str, str]) -> SocialPost:
+        """Post campaign Reddit content to a subreddit matching the genre, once the Reddit limiter allows it"""
+        await self.reddit_limiter.acquire()
+        return await self.post(
+            Platform.REDDIT,
+            reddit_content["body"],
+            hashtags=[],
+            title=reddit_content["title"],
+            subreddit=self._rng.choice(GENRE_TO_SUBREDDITS.get(book.genre, self.subreddits))
+        )
+    
     def get_post_analytics(self) -> Dict:
         """Get analytics about posting activity"""
         return {
             "total_posts": len(self.post_history),
-            "daily_counts": dict(self.daily_post_count),
+            "daily_counts": {p.value: n for p, n in self.daily_post_count.items()},
+            "daily_history": [
+                {"date": day.isoformat(), "counts": {p.value: n for p, n in counts.items()}}
+                for day, counts in self.daily_history
+            ],
             "by_platform": {
-                platform.value: len([p for p in self.post_history if p.platform == platform])
-                for platform in Platform
+                platform.value: self._platform_counts[platform]
+                for platform in PLATFORMS
             },
-            "success_rate": sum(1 for p in self.post_history if p.status == PostStatus.POSTED) / max(1, len(self.post_history))
+            "success_rate": self._status_counts[PostStatus.POSTED] / max(1, len(self.post_history))
         }
 
 
@@ -899,4 +1571,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
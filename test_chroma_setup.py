@@ -11,6 +11,16 @@ try:
         n_results=1
     )
     print(f"ChromaDB Query Result: {result}")
+
+    # Batched path: one add call for 64 documents
+    batch_ids = [f"batch{i}" for i in range(64)]
+    collection.add(
+        documents=[f"Synthetic batch document number {i}" for i in range(64)],
+        ids=batch_ids
+    )
+    stored = collection.get(ids=batch_ids)
+    assert len(stored["ids"]) == 64, f"expected 64 batched documents, got {len(stored['ids'])}"
+    print("✅ Batched add of 64 documents stored all entries.")
     print("✅ ChromaDB is working correctly.")
 except Exception as e:
     print(f"❌ ChromaDB Error: {e}")
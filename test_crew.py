@@ -18,7 +18,10 @@ except ImportError as e:
     print(f"❌ Failed to import CrewManager: {e}")
     sys.exit(1)
 
-def main():
+# Upper bound for the whole crew run, so a stalled LLM or network call cannot hang the check
+CREW_TIMEOUT = 120
+
+async def main():
     print("🚀 Starting CrewAI Verification...")
     
     manager = OpenCLAW_CrewManager()
@@ -36,11 +39,19 @@ def main():
     print(f"Running daily promotion for: {test_book['title']}")
     try:
         # We will use a shortened task description to keep it fast for verification
-        result = manager.run_daily_promotion(test_book)
+        result = await asyncio.wait_for(
+            asyncio.to_thread(manager.run_daily_promotion, test_book),
+            timeout=CREW_TIMEOUT
+        )
         print("\n🏆 Verification Result:")
         print(result)
+    except asyncio.TimeoutError:
+        print(f"❌ Execution timed out after {CREW_TIMEOUT}s")
+        # The crew thread cannot be cancelled; exit instead of waiting for it at loop shutdown
+        sys.stdout.flush()
+        os._exit(1)
     except Exception as e:
         print(f"❌ Execution failed: {e}")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,16 +1,11 @@
-import os
 import sys
+from dotenv import load_dotenv
 from core.p2p_manager import P2PManager
 from core.torrent_manager import TorrentManager
 
 def load_env():
-    """Manual load of .env file if python-dotenv is not used."""
-    if os.path.exists('.env'):
-        with open('.env') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
+    """Load .env into the environment without overriding variables already set."""
+    load_dotenv(override=False)
 
 def test_p2p_integration():
     print("🚀 Starting P2P & Torrent Verification (Env Loaded)...")
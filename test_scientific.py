@@ -11,6 +11,12 @@ def test_scientific_crew():
     
     print("\n✅ Research Cycle Complete!")
     print(f"\nFinal Proposal Snippet:\n{str(result)[:500]}...")
+    
+    print(f"Running parallel research for: {test_topic}")
+    result = manager.conduct_research_parallel(test_topic)
+    
+    print("\n✅ Parallel Research Cycle Complete!")
+    print(f"\nFinal Proposal Snippet:\n{str(result)[:500]}...")
 
 if __name__ == "__main__":
     test_scientific_crew()